@@ -17,22 +17,276 @@ Production (Gunicorn):
     gunicorn "app:create_app()" --bind 0.0.0.0:8000 --workers 4
 """
 
+import contextlib
+import hashlib
+import importlib
+import json
 import os
+import queue
+import secrets
 import sqlite3
+import threading
+import zlib
 
-from flask import Flask, g
+try:
+    import brotli               # installed with flask-compress; gzip is the fallback
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl                # POSIX only; used to serialise first-run seeding
+except ImportError:             # Windows development machines
+    fcntl = None
+
+from flask import Flask, g, request, url_for
+from flask_compress import Compress
 from flask_login import LoginManager
 
-# ── Blueprint imports ─────────────────────────────────────────────────────────
-from routes.home        import home_bp
-from routes.artists     import artists_bp
-from routes.albums      import albums_bp
-from routes.songs       import songs_bp
-from routes.genres      import genres_bp
-from routes.album_songs import album_songs_bp
-from routes.song_genres import song_genres_bp
-from routes.album_genres import album_genres_bp
-from auth               import auth_bp, load_user
+from auth import auth_bp, load_user
+
+# ── Blueprint table: (module, blueprint attribute, URL prefix) ────────────────
+# The route modules are imported inside create_app() rather than at module
+# load, so importing app.py (e.g. by tooling or a Gunicorn master without
+# --preload) does not pull in every blueprint until an app is actually built.
+BLUEPRINTS = [
+    ("routes.home",         "home_bp",         "/"),
+    ("routes.artists",      "artists_bp",      "/artists"),
+    ("routes.albums",       "albums_bp",       "/albums"),
+    ("routes.songs",        "songs_bp",        "/songs"),
+    ("routes.genres",       "genres_bp",       "/genres"),
+    ("routes.album_songs",  "album_songs_bp",  "/album-songs"),
+    ("routes.song_genres",  "song_genres_bp",  "/song-genres"),
+    ("routes.album_genres", "album_genres_bp", "/album-genres"),
+]
+
+
+# ── Secondary indexes (name → DDL), ensured on every boot by _init_db ─────────
+# The junction tables' composite primary keys already cover lookups by their
+# first column; these cover the other direction of each JOIN and the ORDER BY
+# columns of the association list pages.
+INDEXES = {
+    "idx_album_songs_song":   "CREATE INDEX IF NOT EXISTS idx_album_songs_song   ON album_songs(song_id)",
+    "idx_album_genres_genre": "CREATE INDEX IF NOT EXISTS idx_album_genres_genre ON album_genres(genre_id)",
+    "idx_albums_title":       "CREATE INDEX IF NOT EXISTS idx_albums_title       ON albums(title)",
+    "idx_albums_artist_year": "CREATE INDEX IF NOT EXISTS idx_albums_artist_year ON albums(artist_id, release_year)",
+    "idx_songs_title":        "CREATE INDEX IF NOT EXISTS idx_songs_title        ON songs(title, id, duration)",
+    "idx_song_genres_genre":  "CREATE INDEX IF NOT EXISTS idx_song_genres_genre  ON song_genres(genre_id, song_id)",
+}
+
+
+# ── SQLite connection class ───────────────────────────────────────────────────
+class TunedConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that configures itself once, when it is opened.
+
+    Passed as `factory=` to sqlite3.connect(), so the row factory and the
+    PRAGMAs below are applied a single time per connection and then
+    amortised over every request that re-uses it from the pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.row_factory = sqlite3.Row              # rows behave like dicts
+        # SQLite does NOT enforce foreign keys by default — enable it here
+        # so every connection respects referential integrity constraints.
+        self.execute("PRAGMA foreign_keys = ON")
+        # WAL lets readers proceed while a writer is active; NORMAL sync is
+        # durable under WAL and avoids an fsync on every commit.
+        self.execute("PRAGMA journal_mode = WAL")
+        self.execute("PRAGMA synchronous = NORMAL")
+        # Read-side tuning for the list pages: memory-map up to 256 MB of the
+        # file so page reads are served from the mapping rather than read()
+        # syscalls, a ~20 MB page cache, and in-memory temp b-trees for sorts.
+        self.execute("PRAGMA mmap_size = 268435456")
+        self.execute("PRAGMA cache_size = -20000")
+        self.execute("PRAGMA temp_store = MEMORY")
+        # Serialises transaction() with the other writers of this process;
+        # ConnectionPool swaps in its shared lock for the connections it opens.
+        self.write_lock = contextlib.nullcontext()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Run the enclosed writes as one BEGIN IMMEDIATE … COMMIT transaction.
+
+        Connections are opened in autocommit mode (isolation_level=None), so a
+        lone statement commits by itself and a group of statements must be
+        wrapped in this block to commit once.  IMMEDIATE takes the write lock
+        up front, so two writers queue on busy_timeout instead of failing
+        with SQLITE_BUSY when upgrading a read lock.  The connection's
+        write_lock is held throughout, so writers within one process queue
+        on it before they ever reach SQLite's file lock.  Any exception rolls
+        the transaction back and propagates.
+        """
+        with self.write_lock:
+            self.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                # Some errors (SQLITE_FULL, IOERR, interrupt) make SQLite roll
+                # back by itself; a second ROLLBACK would then fail and mask
+                # the original exception.
+                if self.in_transaction:
+                    self.execute("ROLLBACK")
+                raise
+            self.execute("COMMIT")
+
+
+# ── Connection pool ───────────────────────────────────────────────────────────
+class ConnectionPool:
+    """
+    Bounded, lazily filled pool of long-lived TunedConnections for one worker.
+
+    Re-using connections means the file open and PRAGMA set-up are paid once
+    per connection instead of once per request.  Idle connections sit in a
+    LIFO queue, so the most recently used (and therefore warmest) one is
+    handed out first.  Nothing is opened until the first checkout, which
+    keeps connections out of the parent process when Gunicorn forks.
+
+    Blueprints either use current_app.get_db() (one connection for the whole
+    request, returned at teardown) or check one out for a block:
+
+        pool = current_app.extensions["db_pool"]
+        with pool.reader() as db:       # SELECTs — run concurrently under WAL
+            ...
+        with pool.writer() as db:       # INSERT/UPDATE/DELETE
+            ...
+
+    SQLite allows a single writer at a time, so the pool owns one
+    per-process write lock and hands it to every connection it opens.
+    TunedConnection.transaction() takes it — whether the connection came from
+    writer(), reader() or get_db() — so this worker's transactions queue on
+    the lock instead of contending for SQLite's file lock.  writer() holds
+    it for its whole block as well (the lock is re-entrant), which also
+    covers a lone autocommit statement written outside transaction().
+    """
+
+    def __init__(self, database, size):
+        self.database    = database
+        self._idle       = queue.LifoQueue(maxsize=size)
+        self._write_lock = threading.RLock()
+        self._watch      = None                     # see data_version()
+        self._watch_lock = threading.Lock()
+
+    def _connect(self):
+        """Open a new pooled SQLite connection (set up by TunedConnection)."""
+        conn = sqlite3.connect(
+            self.database,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,                # connections move between threads
+            # Route modules keep their SQL in module-level constants, so a
+            # large statement cache lets each pooled connection re-use the
+            # prepared statements instead of re-parsing them per request.
+            cached_statements=256,
+            isolation_level=None,                   # autocommit; see transaction()
+            factory=TunedConnection,
+        )
+        conn.write_lock = self._write_lock
+        return conn
+
+    def acquire(self):
+        """Check out an idle connection, opening a new one if none is free."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn):
+        """Return a connection; it is closed instead if the pool is full."""
+        # Never hand a half-finished transaction to the next user.
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @contextlib.contextmanager
+    def reader(self):
+        """Check out a connection for the duration of a read-only block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextlib.contextmanager
+    def writer(self):
+        """Check out a connection for a block of writes, one writer at a time."""
+        with self._write_lock:
+            conn = self.acquire()
+            try:
+                yield conn
+            finally:
+                self.release(conn)
+
+    def data_version(self):
+        """
+        Return a token that changes whenever the database file is committed to.
+
+        PRAGMA data_version only moves for commits made by *other* connections,
+        so it is read from a dedicated connection that never writes — then
+        every commit, from this worker or any other process, shows up.  The
+        numbers are only comparable on that one connection, so the token is
+        prefixed with a random id chosen when it is opened.
+        """
+        with self._watch_lock:
+            if self._watch is None:
+                self._watch = (
+                    sqlite3.connect(self.database, check_same_thread=False, isolation_level=None),
+                    secrets.token_hex(4),
+                )
+            conn, prefix = self._watch
+            return f"{prefix}-{conn.execute('PRAGMA data_version').fetchone()[0]}"
+
+
+# ── Streamed responses ────────────────────────────────────────────────────────
+# Jinja yields a streamed page a few bytes at a time; chunks are joined up to
+# this size so the WSGI server writes a handful of packets instead of thousands.
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Encodings app.stream_response() can produce, in order of preference
+STREAM_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _buffered(chunks, size=STREAM_CHUNK_SIZE):
+    """Regroup an iterable of small strings into chunks of roughly `size` chars."""
+    buf, buffered = [], 0
+    for chunk in chunks:
+        buf.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield "".join(buf)
+            buf, buffered = [], 0
+    if buf:
+        yield "".join(buf)
+
+
+def _encoded(chunks, encoding, config):
+    """
+    Compress a stream of text chunks, flushing the compressor after each one.
+
+    Flask-Compress only flushes at the end of a stream, which would hold the
+    whole page back until it is rendered; a flush per chunk costs a few bytes
+    of ratio but lets every chunk reach the client as soon as it is ready.
+    Levels and Brotli parameters come from the same COMPRESS_* settings that
+    Flask-Compress uses for every other response.
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(
+            mode=config["COMPRESS_BR_MODE"],
+            quality=config["COMPRESS_BR_LEVEL"],
+            lgwin=config["COMPRESS_BR_WINDOW"],
+            lgblock=config["COMPRESS_BR_BLOCK"],
+        )
+        for chunk in chunks:
+            yield compressor.process(chunk.encode()) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(config["COMPRESS_LEVEL"], zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            yield compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
 
 
 def create_app():
@@ -43,12 +297,66 @@ def create_app():
     # ── Secret key (override via SECRET_KEY env var in production) ────────────
     app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-change-in-prod")
 
+    # ── Session cookie: only (re)sent when the session actually changes ───────
+    app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
+    app.config["SESSION_REFRESH_EACH_REQUEST"] = False
+
     # ── Database path inside the instance/ folder ─────────────────────────────
     app.config["DATABASE"] = os.path.join(app.instance_path, "music.db")
 
+    # ── Let browsers and proxies cache /static/* (sent as Cache-Control: public) ─
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = int(os.environ.get("STATIC_MAX_AGE", "300"))
+
+    # ── Maximum number of idle connections kept open per worker process ───────
+    app.config["DATABASE_POOL_SIZE"] = int(os.environ.get("DATABASE_POOL_SIZE", "8"))
+
+    # ── Response compression (HTML and CSS only; images are already compact) ─
+    # Brotli level 5 compresses the long association tables several-fold while
+    # staying well below the cost of rendering them.
+    app.config["COMPRESS_MIMETYPES"] = ["text/html", "text/css"]
+    app.config["COMPRESS_BR_LEVEL"]  = 5
+    # Routes that support If-None-Match (song_genres.index) decide on 304s
+    # themselves, e.g. never while a flash message is pending; Flask-Compress
+    # must not second-guess them after the fact.
+    app.config["COMPRESS_EVALUATE_CONDITIONAL_REQUEST"] = False
+    Compress(app)
+
+    def stream_response(chunks, mimetype="text/html"):
+        """
+        Build a streamed response from text chunks (e.g. stream_template()).
+
+        Compression follows the Flask-Compress settings — COMPRESS_MIMETYPES,
+        COMPRESS_STREAMS, COMPRESS_ALGORITHM's order and the levels — but is
+        done here, flushed per chunk.  Flask-Compress skips responses that
+        already carry a Content-Encoding and only adds its Vary header.
+        COMPRESS_MIN_SIZE does not apply: a stream's length is not known.
+        """
+        chunks = _buffered(chunks)
+        config = app.config
+        algorithms = config["COMPRESS_ALGORITHM"]
+        if isinstance(algorithms, str):
+            algorithms = [a.strip() for a in algorithms.split(",")]
+        offered = [a for a in algorithms if a in STREAM_ENCODINGS]
+
+        encoding = None
+        if config["COMPRESS_STREAMS"] and mimetype in config["COMPRESS_MIMETYPES"]:
+            encoding = request.accept_encodings.best_match(offered)
+        if encoding is None:
+            return app.response_class(chunks, mimetype=mimetype)
+
+        response = app.response_class(_encoded(chunks, encoding, config), mimetype=mimetype)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    # Attached like get_db, so blueprints need not import app.py
+    app.stream_response = stream_response
+
     # Ensure the instance folder exists
     os.makedirs(app.instance_path, exist_ok=True)
 
+    # ── Fingerprinted static assets (written by build_css.py) ─────────────────
+    current_manifest = _init_assets(app)
+
     # ── Flask-Login setup ─────────────────────────────────────────────────────
     login_manager = LoginManager(app)
     login_manager.login_view = "auth.login"          # redirect unauthenticated users here
@@ -57,23 +365,20 @@ def create_app():
     login_manager.user_loader(load_user)
 
     # ── Database helpers ──────────────────────────────────────────────────────
+    pool = ConnectionPool(app.config["DATABASE"], app.config["DATABASE_POOL_SIZE"])
+    app.extensions["db_pool"] = pool
+
     def get_db():
         """
         Return the SQLite connection for the current request.
 
-        The connection is stored on Flask's application-context object `g`
-        so that the same connection is reused for all queries within a single
-        request, and closed automatically when the request ends.
+        A connection is checked out of the pool on first use and stored on
+        Flask's application-context object `g`, so the same connection is
+        reused for all queries within a single request.  It is handed back
+        to the pool automatically when the request ends.
         """
         if "db" not in g:
-            g.db = sqlite3.connect(
-                app.config["DATABASE"],
-                detect_types=sqlite3.PARSE_DECLTYPES,
-            )
-            g.db.row_factory = sqlite3.Row          # rows behave like dicts
-            # SQLite does NOT enforce foreign keys by default — enable it here
-            # so every connection respects referential integrity constraints.
-            g.db.execute("PRAGMA foreign_keys = ON")
+            g.db = pool.acquire()
         return g.db
 
     # Attach get_db to the app so blueprints can call current_app.get_db()
@@ -82,45 +387,197 @@ def create_app():
 
     @app.teardown_appcontext
     def close_db(exception=None):
-        """Close the database connection at the end of every request."""
+        """Return the request's connection to the pool at the end of every request."""
         db = g.pop("db", None)
         if db is not None:
-            db.close()
+            pool.release(db)
 
     # ── Initialise / seed the database on first use ───────────────────────────
     _init_db(app)
 
+    # ── Compile every template up front ───────────────────────────────────────
+    # Jinja caches compiled templates on the environment, but only once each
+    # one is first rendered.  Loading them here moves that parse/compile cost
+    # out of the first request served by each worker.  Auto-reload is left to
+    # Flask's default (on only in debug mode).  trim_blocks/lstrip_blocks drop
+    # the blank lines and indentation that block tags ({% for %}, {% if %})
+    # would otherwise repeat for every table row.
+    app.jinja_env.trim_blocks   = True
+    app.jinja_env.lstrip_blocks = True
+    # The template sources (plus APP_VERSION, when a deploy sets it) are
+    # hashed on the way, giving an id for the markup this process serves.
+    build = hashlib.blake2b(os.environ.get("APP_VERSION", "").encode(), digest_size=8)
+    for template_name in sorted(app.jinja_env.list_templates(extensions=["html"])):
+        app.jinja_env.get_template(template_name)
+        build.update(app.jinja_env.loader.get_source(app.jinja_env, template_name)[0].encode())
+    build_id = build.hexdigest()
+
+    def build_token():
+        """
+        Return a short id for the HTML this app renders.
+
+        It changes when a template, APP_VERSION or the built stylesheet
+        changes, so validators such as ETags derived from the data alone can
+        mix it in and stop matching pages rendered by an earlier release.
+        """
+        css = current_manifest().get("css/main.css", "")
+        return hashlib.blake2b(f"{build_id}:{css}".encode(), digest_size=4).hexdigest()
+
+    # Attached like get_db, so blueprints need not import app.py
+    app.build_token = build_token
+
     # ── Register Blueprints ───────────────────────────────────────────────────
-    app.register_blueprint(auth_bp,        url_prefix="/auth")
-    app.register_blueprint(home_bp,        url_prefix="/")
-    app.register_blueprint(artists_bp,     url_prefix="/artists")
-    app.register_blueprint(albums_bp,      url_prefix="/albums")
-    app.register_blueprint(songs_bp,       url_prefix="/songs")
-    app.register_blueprint(genres_bp,      url_prefix="/genres")
-    app.register_blueprint(album_songs_bp, url_prefix="/album-songs")
-    app.register_blueprint(song_genres_bp, url_prefix="/song-genres")
-    app.register_blueprint(album_genres_bp,url_prefix="/album-genres")
+    app.register_blueprint(auth_bp, url_prefix="/auth")
+    for module_name, attr, url_prefix in BLUEPRINTS:
+        blueprint = getattr(importlib.import_module(module_name), attr)
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
 
     return app
 
 
+def _init_assets(app):
+    """
+    Register the asset_url() template helper for fingerprinted static files.
+
+    build_css.py writes static/css/manifest.json mapping a logical name such
+    as "css/main.css" to its content-hashed copy ("css/main.<digest>.css").
+    asset_url() resolves names through that manifest and falls back to the
+    plain file when no build has been run.  Because a hashed file's content
+    can never change, Flask serves those with a one-year cache lifetime.
+
+    The manifest is re-read whenever its mtime changes, so rebuilding the CSS
+    while the server runs switches pages to the new stylesheet without a
+    restart.  Returns the function that yields the current manifest.
+    """
+    manifest_path = os.path.join(app.static_folder, "css", "manifest.json")
+    # Last manifest read: (mtime_ns or None, name -> hashed name)
+    loaded = [None, {}]
+
+    def current_manifest():
+        try:
+            mtime = os.stat(manifest_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != loaded[0]:
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            loaded[:] = [mtime, manifest]
+        return loaded[1]
+
+    default_max_age = app.get_send_file_max_age
+
+    def get_send_file_max_age(filename):
+        if filename in current_manifest().values():
+            return 365 * 24 * 3600
+        return default_max_age(filename)
+
+    app.get_send_file_max_age = get_send_file_max_age
+
+    @app.template_global()
+    def asset_url(filename):
+        """url_for('static', ...) for `filename`, using its fingerprinted copy if built."""
+        return url_for("static", filename=current_manifest().get(filename, filename))
+
+    return current_manifest
+
+
 def _init_db(app):
     """
-    Create and seed the database if it does not already exist.
+    Create and seed the database unless it has already been seeded.
 
     The SQL script (music_database.sql) contains both the DDL (CREATE TABLE
     statements with foreign-key constraints) and the seed INSERT statements.
-    Running it is idempotent because every CREATE TABLE uses IF NOT EXISTS.
+
+    Every Gunicorn worker runs the factory, so seeding is serialised with an
+    exclusive lock on a file next to the database: the first worker seeds,
+    the others wait on the lock and then find the `artists` table present.
+    Checking for the table rather than the file also copes with an empty
+    file left behind by an earlier crash.
     """
-    db_path  = app.config["DATABASE"]
-    sql_path = os.path.join(os.path.dirname(__file__), "music_database.sql")
+    db_path   = app.config["DATABASE"]
+    sql_path  = os.path.join(os.path.dirname(__file__), "music_database.sql")
+    lock_path = db_path + ".init.lock"
 
+    with open(lock_path, "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)   # released when the file closes
+        if not _is_seeded(db_path):
+            _seed_db(db_path, sql_path)
+            print(f"[db] Initialised database at {db_path}")
+        _ensure_indexes(db_path)
+
+
+def _is_seeded(db_path):
+    """Return True if the database file exists and already has the schema."""
     if not os.path.exists(db_path):
-        with sqlite3.connect(db_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
-            with open(sql_path, "r") as f:
-                conn.executescript(f.read())
-        print(f"[db] Initialised database at {db_path}")
+        return False            # don't let sqlite3.connect() create it here
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artists'"
+        ).fetchone()
+    finally:
+        conn.close()
+    return row is not None
+
+
+def _ensure_indexes(db_path):
+    """
+    Create any missing INDEXES, then refresh the planner statistics.
+
+    Existing databases pick up new indexes on their next boot.  ANALYZE only
+    runs when something was actually created, so a normal boot costs a single
+    sqlite_master lookup.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        existing = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )}
+        created = 0
+        for name, ddl in INDEXES.items():
+            if name in existing:
+                continue
+            try:
+                conn.execute(ddl)
+                created += 1
+            except sqlite3.OperationalError as e:
+                # e.g. a database created from an older schema without the column
+                print(f"[db] Skipped index {name}: {e}")
+        if created:
+            conn.execute("ANALYZE")
+            print(f"[db] Created {created} index(es) and refreshed statistics")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _seed_db(db_path, sql_path):
+    """Run the schema + seed script against a new (or empty) database file."""
+    with open(sql_path, "r") as f:
+        script = f.read()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Bulk-load settings: no rollback journal, no fsync per write and
+        # temporary b-trees in memory.  A crash part-way through only
+        # loses a file we delete below anyway.
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Run the whole script as one transaction (one commit, not one per INSERT)
+        conn.executescript("BEGIN;\n" + script + "\nCOMMIT;")
+        # Leave the file in WAL mode, which the request connections use
+        conn.execute("PRAGMA journal_mode = WAL")
+    except Exception:
+        conn.close()
+        os.remove(db_path)          # never leave a half-seeded database behind
+        raise
+    conn.close()
 
 
 # ── Development server entry point ────────────────────────────────────────────
@@ -12,7 +12,9 @@ In a production system the USERS dict would be replaced by a database
 table with bcrypt-hashed passwords.
 """
 
-from functools import wraps
+import sys
+from functools import lru_cache, wraps
+from types import MappingProxyType
 
 from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_login import UserMixin, current_user, login_required, login_user, logout_user
@@ -20,12 +22,16 @@ from flask_login import UserMixin, current_user, login_required, login_user, log
 # ── Hard-coded user store ─────────────────────────────────────────────────────
 # Keys are usernames; values are plain-text passwords (demo only).
 # The superuser is identified by the username 'sandro63'.
-USERS = {
+# Wrapped in a read-only proxy: the store never changes at runtime, which is
+# also what makes memoising load_user() safe.
+USERS = MappingProxyType({
     "sandro63": "sandro63",   # superuser — has delete privilege
     "guest":    "guest",      # regular user — create & update only
-}
+})
 
-SUPERUSER = "sandro63"
+# Interned, as are User ids, so the superuser check usually short-circuits
+# on object identity inside the string comparison.
+SUPERUSER = sys.intern("sandro63")
 
 
 # ── Flask-Login User class ────────────────────────────────────────────────────
@@ -37,8 +43,10 @@ class User(UserMixin):
     cookie and calls load_user() on every request to reconstruct this object.
     """
 
+    __slots__ = ("id",)
+
     def __init__(self, username: str):
-        self.id = username          # Flask-Login uses `id` as the session key
+        self.id = sys.intern(username)  # Flask-Login uses `id` as the session key
 
     @property
     def is_superuser(self) -> bool:
@@ -46,12 +54,16 @@ class User(UserMixin):
         return self.id == SUPERUSER
 
 
+@lru_cache(maxsize=64)
 def load_user(user_id: str):
     """
     Flask-Login user loader callback.
 
     Called on every request with the user_id stored in the session cookie.
     Returns a User instance if the id is valid, or None to force logout.
+
+    USERS does not change at runtime and User objects are immutable, so the
+    result is memoised and the same instance is shared between requests.
     """
     if user_id in USERS:
         return User(user_id)
@@ -2,19 +2,124 @@
 build_css.py — Compile static/scss/main.scss → static/css/main.css using libsass.
 
 Run once before starting the server (or whenever the SCSS changes):
-    python3 build_css.py
+    python3 build_css.py            # skips the compile if main.css is up to date
+    python3 build_css.py --force    # always recompile
+
+The build is skipped when no .scss file under static/scss/ (main.scss and any
+partials it @imports) has changed since the last one.  Each build records the
+newest source mtime it compiled in static/css/main.css.stamp, and that is what
+the sources are compared against: main.css itself is only rewritten when the
+CSS actually changed, so its mtime stays put for anything watching it and
+cannot serve as the marker.
+
+Alongside main.css the build writes a content-hashed copy,
+main.<digest>.css, plus pre-compressed .gz (and .br, when the optional
+`brotli` package is installed) variants of it.  static/css/manifest.json maps
+"css/main.css" to the hashed name; the asset_url() template helper reads it,
+so browsers can cache the stylesheet indefinitely and a new build simply
+changes the URL.  The previous build's files are kept, so pages rendered
+before the rebuild still find their stylesheet; anything older is removed.
 """
 
+import glob
+import gzip
+import hashlib
+import json
 import os
+import sys
+
 import sass  # provided by the 'libsass' pip package
 
-BASE = os.path.dirname(__file__)
-SRC  = os.path.join(BASE, "static", "scss", "main.scss")
-DST  = os.path.join(BASE, "static", "css",  "main.css")
+try:
+    import brotli           # optional — only used to emit a .br variant
+except ImportError:
+    brotli = None
+
+BASE     = os.path.dirname(__file__)
+SCSS_DIR = os.path.join(BASE, "static", "scss")
+CSS_DIR  = os.path.join(BASE, "static", "css")
+SRC      = os.path.join(SCSS_DIR, "main.scss")
+DST      = os.path.join(CSS_DIR, "main.css")
+MANIFEST = os.path.join(CSS_DIR, "manifest.json")
+STAMP    = os.path.join(CSS_DIR, "main.css.stamp")
+
+
+def newest_source_mtime():
+    """Return the latest mtime of any Sass source file under static/scss/."""
+    newest = 0.0
+    for root, _dirs, files in os.walk(SCSS_DIR):
+        for name in files:
+            if name.endswith((".scss", ".sass")):
+                newest = max(newest, os.path.getmtime(os.path.join(root, name)))
+    return newest
+
+
+def is_up_to_date():
+    """True if the outputs exist and no Sass source changed since the last build."""
+    try:
+        with open(STAMP) as f:
+            built_from = float(f.read())
+    except (OSError, ValueError):   # first build, or the stamp is unreadable
+        return False
+    return (os.path.exists(DST) and os.path.exists(MANIFEST)
+            and newest_source_mtime() <= built_from)
+
 
+def write_fingerprinted(css):
+    """Write main.<digest>.css (+ compressed variants) and update the manifest."""
+    data   = css.encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    name   = f"main.{digest}.css"
+    path   = os.path.join(CSS_DIR, name)
+
+    # Keep this build and the one it replaces; drop anything older
+    keep = {name}
+    try:
+        with open(MANIFEST) as f:
+            keep.add(os.path.basename(json.load(f)["css/main.css"]))
+    except (OSError, ValueError, KeyError):
+        pass
+    for old in glob.glob(os.path.join(CSS_DIR, "main.*.css*")):
+        if not os.path.basename(old).startswith(tuple(keep)):
+            os.remove(old)
+
+    with open(path, "wb") as f:
+        f.write(data)
+    # mtime=0 keeps the .gz byte-identical across rebuilds of the same CSS
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+
+    with open(MANIFEST, "w") as f:
+        json.dump({"css/main.css": f"css/{name}"}, f, indent=2)
+    return name
+
+
+if "--force" not in sys.argv and is_up_to_date():
+    print(f"{DST} is up to date — nothing to do")
+    sys.exit(0)
+
+# Read before compiling, so a save during the compile triggers the next build
+sources_mtime = newest_source_mtime()
 css = sass.compile(filename=SRC, output_style="compressed")
-os.makedirs(os.path.dirname(DST), exist_ok=True)
-with open(DST, "w") as f:
-    f.write(css)
 
-print(f"Compiled {SRC} → {DST}  ({len(css):,} bytes)")
+try:
+    with open(DST, "r") as f:
+        unchanged = f.read() == css
+except OSError:
+    unchanged = False
+
+if unchanged:
+    print(f"Compiled {SRC} — output unchanged, {DST} left as is")
+else:
+    os.makedirs(CSS_DIR, exist_ok=True)
+    with open(DST, "w") as f:
+        f.write(css)
+    print(f"Compiled {SRC} → {DST}  ({len(css):,} bytes)")
+
+print(f"Fingerprinted copy: static/css/{write_fingerprinted(css)}")
+
+with open(STAMP, "w") as f:
+    f.write(repr(sources_mtime))
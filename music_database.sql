@@ -18,6 +18,7 @@ CREATE TABLE albums (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     title TEXT NOT NULL,
     artist_id INTEGER NOT NULL,
+    release_year INTEGER,
     FOREIGN KEY (artist_id) REFERENCES artists(id)
 );
 
@@ -14,26 +14,33 @@ from flask import Blueprint, current_app, flash, redirect, render_template, requ
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import get_options
 
 album_genres_bp = Blueprint("album_genres", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+SQL_LIST_ALBUM_GENRES = """
+    SELECT al.id AS album_id, al.title AS album_title,
+           g.id  AS genre_id, g.name   AS genre_name
+    FROM album_genres ag
+    JOIN albums al ON al.id = ag.album_id
+    JOIN genres g  ON g.id  = ag.genre_id
+    ORDER BY al.title, g.name
+"""
+SQL_INSERT_ALBUM_GENRE = "INSERT OR IGNORE INTO album_genres (album_id, genre_id) VALUES (?, ?)"
+SQL_DELETE_ALBUM_GENRE = "DELETE FROM album_genres WHERE album_id = ? AND genre_id = ?"
+
 
 @album_genres_bp.route("/")
 @login_required
 def index():
     db = current_app.get_db()
 
-    rows = db.execute("""
-        SELECT al.id AS album_id, al.title AS album_title,
-               g.id  AS genre_id, g.name   AS genre_name
-        FROM album_genres ag
-        JOIN albums al ON al.id = ag.album_id
-        JOIN genres g  ON g.id  = ag.genre_id
-        ORDER BY al.title, g.name
-    """).fetchall()
+    rows = db.execute(SQL_LIST_ALBUM_GENRES).fetchall()
 
-    albums = db.execute("SELECT id, title FROM albums ORDER BY title").fetchall()
-    genres = db.execute("SELECT id, name  FROM genres ORDER BY name").fetchall()
+    albums = get_options(db, "albums")
+    genres = get_options(db, "genres")
 
     return render_template("album_genres/index.html", rows=rows, albums=albums, genres=genres)
 
@@ -41,21 +48,39 @@ def index():
 @album_genres_bp.route("/add", methods=["POST"])
 @login_required
 def add():
+    """
+    Link one album to one or more genres.
+
+    Several `genre_id` values may be posted at once; all pairs are inserted
+    with a single executemany() inside one transaction, so N associations
+    cost one commit rather than N.  Pairs that already exist are skipped
+    (INSERT OR IGNORE) rather than failing the batch; a value that is not an
+    integer id rejects the whole request.
+    """
     album_id = request.form.get("album_id", "").strip()
-    genre_id = request.form.get("genre_id", "").strip()
+    genre_ids = [v.strip() for v in request.form.getlist("genre_id") if v.strip()]
 
-    if not album_id or not genre_id:
+    if not album_id or not genre_ids:
         flash("Both album and genre are required.", "danger")
         return redirect(url_for("album_genres.index"))
 
+    try:
+        pairs = [(int(album_id), int(genre_id)) for genre_id in genre_ids]
+    except ValueError:
+        flash("Invalid album or genre.", "danger")
+        return redirect(url_for("album_genres.index"))
+
     db = current_app.get_db()
     try:
-        db.execute(
-            "INSERT INTO album_genres (album_id, genre_id) VALUES (?, ?)",
-            (int(album_id), int(genre_id)),
-        )
-        db.commit()
-        flash("Association added.", "success")
+        with db.transaction():                  # one transaction, one commit
+            added = db.executemany(SQL_INSERT_ALBUM_GENRE, pairs).rowcount
+        invalidate_counts()
+        if added == 0:
+            flash("Association already exists.", "info")
+        elif added == 1:
+            flash("Association added.", "success")
+        else:
+            flash(f"{added} associations added.", "success")
     except Exception as e:
         flash(f"Error: {e}", "danger")
 
@@ -66,16 +91,19 @@ def add():
 @login_required
 @superuser_required
 def remove():
-    album_id = request.form.get("album_id", "").strip()
-    genre_id = request.form.get("genre_id", "").strip()
+    # Validate before acquiring a pooled connection, so bad input never holds one
+    try:
+        album_id = int(request.form.get("album_id", ""))
+        genre_id = int(request.form.get("genre_id", ""))
+    except ValueError:
+        flash("Both album and genre are required.", "danger")
+        return redirect(url_for("album_genres.index"))
 
     db = current_app.get_db()
     try:
-        db.execute(
-            "DELETE FROM album_genres WHERE album_id = ? AND genre_id = ?",
-            (int(album_id), int(genre_id)),
-        )
-        db.commit()
+        with db.transaction():
+            db.execute(SQL_DELETE_ALBUM_GENRE, (album_id, genre_id))
+        invalidate_counts()
         flash("Association removed.", "success")
     except Exception as e:
         flash(f"Error: {e}", "danger")
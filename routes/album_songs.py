@@ -15,27 +15,34 @@ from flask import Blueprint, current_app, flash, redirect, render_template, requ
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import get_options
 
 album_songs_bp = Blueprint("album_songs", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+# All existing associations with human-readable names
+SQL_LIST_ALBUM_SONGS = """
+    SELECT al.id AS album_id, al.title AS album_title,
+           s.id  AS song_id,  s.title  AS song_title
+    FROM album_songs als
+    JOIN albums al ON al.id = als.album_id
+    JOIN songs  s  ON s.id  = als.song_id
+    ORDER BY al.title, s.title
+"""
+SQL_INSERT_ALBUM_SONG = "INSERT OR IGNORE INTO album_songs (album_id, song_id) VALUES (?, ?)"
+SQL_DELETE_ALBUM_SONG = "DELETE FROM album_songs WHERE album_id = ? AND song_id = ?"
+
 
 @album_songs_bp.route("/")
 @login_required
 def index():
     db = current_app.get_db()
 
-    # All existing associations with human-readable names
-    rows = db.execute("""
-        SELECT al.id AS album_id, al.title AS album_title,
-               s.id  AS song_id,  s.title  AS song_title
-        FROM album_songs als
-        JOIN albums al ON al.id = als.album_id
-        JOIN songs  s  ON s.id  = als.song_id
-        ORDER BY al.title, s.title
-    """).fetchall()
+    rows = db.execute(SQL_LIST_ALBUM_SONGS).fetchall()
 
-    albums = db.execute("SELECT id, title FROM albums ORDER BY title").fetchall()
-    songs  = db.execute("SELECT id, title FROM songs  ORDER BY title").fetchall()
+    albums = get_options(db, "albums")
+    songs  = get_options(db, "songs")
 
     return render_template("album_songs/index.html", rows=rows, albums=albums, songs=songs)
 
@@ -43,21 +50,39 @@ def index():
 @album_songs_bp.route("/add", methods=["POST"])
 @login_required
 def add():
+    """
+    Link one album to one or more songs.
+
+    Several `song_id` values may be posted at once; all pairs are inserted
+    with a single executemany() inside one transaction, so N associations
+    cost one commit rather than N.  Pairs that already exist are skipped
+    (INSERT OR IGNORE) rather than failing the batch; a value that is not an
+    integer id rejects the whole request.
+    """
     album_id = request.form.get("album_id", "").strip()
-    song_id  = request.form.get("song_id",  "").strip()
+    song_ids = [v.strip() for v in request.form.getlist("song_id") if v.strip()]
 
-    if not album_id or not song_id:
+    if not album_id or not song_ids:
         flash("Both album and song are required.", "danger")
         return redirect(url_for("album_songs.index"))
 
+    try:
+        pairs = [(int(album_id), int(song_id)) for song_id in song_ids]
+    except ValueError:
+        flash("Invalid album or song.", "danger")
+        return redirect(url_for("album_songs.index"))
+
     db = current_app.get_db()
     try:
-        db.execute(
-            "INSERT INTO album_songs (album_id, song_id) VALUES (?, ?)",
-            (int(album_id), int(song_id)),
-        )
-        db.commit()
-        flash("Association added.", "success")
+        with db.transaction():                  # one transaction, one commit
+            added = db.executemany(SQL_INSERT_ALBUM_SONG, pairs).rowcount
+        invalidate_counts()
+        if added == 0:
+            flash("Association already exists.", "info")
+        elif added == 1:
+            flash("Association added.", "success")
+        else:
+            flash(f"{added} associations added.", "success")
     except Exception as e:
         flash(f"Error: {e}", "danger")
 
@@ -68,16 +93,19 @@ def add():
 @login_required
 @superuser_required
 def remove():
-    album_id = request.form.get("album_id", "").strip()
-    song_id  = request.form.get("song_id",  "").strip()
+    # Validate before acquiring a pooled connection, so bad input never holds one
+    try:
+        album_id = int(request.form.get("album_id", ""))
+        song_id  = int(request.form.get("song_id",  ""))
+    except ValueError:
+        flash("Both album and song are required.", "danger")
+        return redirect(url_for("album_songs.index"))
 
     db = current_app.get_db()
     try:
-        db.execute(
-            "DELETE FROM album_songs WHERE album_id = ? AND song_id = ?",
-            (int(album_id), int(song_id)),
-        )
-        db.commit()
+        with db.transaction():
+            db.execute(SQL_DELETE_ALBUM_SONG, (album_id, song_id))
+        invalidate_counts()
         flash("Association removed.", "success")
     except Exception as e:
         flash(f"Error: {e}", "danger")
@@ -18,21 +18,33 @@ from flask import Blueprint, current_app, flash, redirect, render_template, requ
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import get_options, invalidate_options
 
 albums_bp = Blueprint("albums", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+# JOIN to show the artist name alongside each album.  Driving the join from
+# artists lets SQLite walk artists in name order (UNIQUE index on name) and
+# each artist's albums in year order (idx_albums_artist_year), so the rows
+# stream out already sorted instead of going through a temp b-tree.
+SQL_LIST_ALBUMS = """
+    SELECT al.id, al.title, al.release_year, ar.name AS artist_name
+    FROM artists ar
+    JOIN albums al ON al.artist_id = ar.id
+    ORDER BY ar.name, al.release_year
+"""
+SQL_GET_ALBUM       = "SELECT * FROM albums WHERE id = ?"
+SQL_INSERT_ALBUM    = "INSERT INTO albums (title, artist_id, release_year) VALUES (?, ?, ?)"
+SQL_UPDATE_ALBUM    = "UPDATE albums SET title = ?, artist_id = ?, release_year = ? WHERE id = ?"
+SQL_DELETE_ALBUM    = "DELETE FROM albums WHERE id = ? RETURNING title"
+
 
 @albums_bp.route("/")
 @login_required
 def index():
     db = current_app.get_db()
-    # JOIN to show the artist name alongside each album
-    albums = db.execute("""
-        SELECT al.id, al.title, al.release_year, ar.name AS artist_name
-        FROM albums al
-        JOIN artists ar ON ar.id = al.artist_id
-        ORDER BY ar.name, al.release_year
-    """).fetchall()
+    albums = db.execute(SQL_LIST_ALBUMS).fetchall()
     return render_template("albums/index.html", albums=albums)
 
 
@@ -40,7 +52,7 @@ def index():
 @login_required
 def create():
     db      = current_app.get_db()
-    artists = db.execute("SELECT id, name FROM artists ORDER BY name").fetchall()
+    artists = get_options(db, "artists")
 
     if request.method == "POST":
         title        = request.form.get("title", "").strip()
@@ -52,11 +64,10 @@ def create():
             return render_template("albums/form.html", action="Create", album=None, artists=artists)
 
         try:
-            db.execute(
-                "INSERT INTO albums (title, artist_id, release_year) VALUES (?, ?, ?)",
-                (title, int(artist_id), release_year),
-            )
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_INSERT_ALBUM, (title, int(artist_id), release_year))
+            invalidate_options("albums")
+            invalidate_counts()
             flash(f"Album '{title}' created.", "success")
             return redirect(url_for("albums.index"))
         except Exception as e:
@@ -69,8 +80,8 @@ def create():
 @login_required
 def edit(album_id):
     db      = current_app.get_db()
-    album   = db.execute("SELECT * FROM albums WHERE id = ?", (album_id,)).fetchone()
-    artists = db.execute("SELECT id, name FROM artists ORDER BY name").fetchall()
+    album   = db.execute(SQL_GET_ALBUM, (album_id,)).fetchone()
+    artists = get_options(db, "artists")
 
     if album is None:
         flash("Album not found.", "danger")
@@ -86,11 +97,9 @@ def edit(album_id):
             return render_template("albums/form.html", action="Update", album=album, artists=artists)
 
         try:
-            db.execute(
-                "UPDATE albums SET title = ?, artist_id = ?, release_year = ? WHERE id = ?",
-                (title, int(artist_id), release_year, album_id),
-            )
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_UPDATE_ALBUM, (title, int(artist_id), release_year, album_id))
+            invalidate_options("albums")
             flash(f"Album '{title}' updated.", "success")
             return redirect(url_for("albums.index"))
         except Exception as e:
@@ -103,18 +112,21 @@ def edit(album_id):
 @login_required
 @superuser_required
 def delete(album_id):
-    db    = current_app.get_db()
-    album = db.execute("SELECT title FROM albums WHERE id = ?", (album_id,)).fetchone()
+    db = current_app.get_db()
+    try:
+        # RETURNING hands back the title for the flash message, so no separate
+        # existence-check SELECT is needed — no row means it didn't exist.
+        with db.transaction():
+            album = db.execute(SQL_DELETE_ALBUM, (album_id,)).fetchone()
+    except Exception as e:
+        flash(f"Cannot delete: {e}", "danger")
+        return redirect(url_for("albums.index"))
 
     if album is None:
         flash("Album not found.", "danger")
         return redirect(url_for("albums.index"))
 
-    try:
-        db.execute("DELETE FROM albums WHERE id = ?", (album_id,))
-        db.commit()
-        flash(f"Album '{album['title']}' deleted.", "success")
-    except Exception as e:
-        flash(f"Cannot delete: {e}", "danger")
-
+    invalidate_options("albums")
+    invalidate_counts()
+    flash(f"Album '{album['title']}' deleted.", "success")
     return redirect(url_for("albums.index"))
@@ -15,16 +15,25 @@ from flask import Blueprint, current_app, flash, redirect, render_template, requ
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import invalidate_options
 
 artists_bp = Blueprint("artists", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+SQL_LIST_ARTISTS    = "SELECT * FROM artists ORDER BY name"
+SQL_GET_ARTIST      = "SELECT * FROM artists WHERE id = ?"
+SQL_INSERT_ARTIST   = "INSERT INTO artists (name, bio) VALUES (?, ?)"
+SQL_UPDATE_ARTIST   = "UPDATE artists SET name = ?, bio = ? WHERE id = ?"
+SQL_DELETE_ARTIST   = "DELETE FROM artists WHERE id = ? RETURNING name"
+
 
 @artists_bp.route("/")
 @login_required
 def index():
     """Return a list of all artists ordered by name."""
     db = current_app.get_db()
-    artists = db.execute("SELECT * FROM artists ORDER BY name").fetchall()
+    artists = db.execute(SQL_LIST_ARTISTS).fetchall()
     return render_template("artists/index.html", artists=artists)
 
 
@@ -42,8 +51,10 @@ def create():
 
         db = current_app.get_db()
         try:
-            db.execute("INSERT INTO artists (name, bio) VALUES (?, ?)", (name, bio))
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_INSERT_ARTIST, (name, bio))
+            invalidate_options("artists")
+            invalidate_counts()
             flash(f"Artist '{name}' created.", "success")
             return redirect(url_for("artists.index"))
         except Exception as e:
@@ -57,7 +68,7 @@ def create():
 def edit(artist_id):
     """Show the edit form (GET) or update an existing artist (POST)."""
     db     = current_app.get_db()
-    artist = db.execute("SELECT * FROM artists WHERE id = ?", (artist_id,)).fetchone()
+    artist = db.execute(SQL_GET_ARTIST, (artist_id,)).fetchone()
 
     if artist is None:
         flash("Artist not found.", "danger")
@@ -72,11 +83,9 @@ def edit(artist_id):
             return render_template("artists/form.html", action="Update", artist=artist)
 
         try:
-            db.execute(
-                "UPDATE artists SET name = ?, bio = ? WHERE id = ?",
-                (name, bio, artist_id),
-            )
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_UPDATE_ARTIST, (name, bio, artist_id))
+            invalidate_options("artists")
             flash(f"Artist '{name}' updated.", "success")
             return redirect(url_for("artists.index"))
         except Exception as e:
@@ -96,18 +105,21 @@ def delete(artist_id):
     The foreign-key constraint on `albums.artist_id` will raise an error if
     the artist still has albums; that error is caught and shown as a flash msg.
     """
-    db     = current_app.get_db()
-    artist = db.execute("SELECT name FROM artists WHERE id = ?", (artist_id,)).fetchone()
+    db = current_app.get_db()
+    try:
+        # RETURNING hands back the name for the flash message, so no separate
+        # existence-check SELECT is needed — no row means it didn't exist.
+        with db.transaction():
+            artist = db.execute(SQL_DELETE_ARTIST, (artist_id,)).fetchone()
+    except Exception as e:
+        flash(f"Cannot delete: {e}", "danger")
+        return redirect(url_for("artists.index"))
 
     if artist is None:
         flash("Artist not found.", "danger")
         return redirect(url_for("artists.index"))
 
-    try:
-        db.execute("DELETE FROM artists WHERE id = ?", (artist_id,))
-        db.commit()
-        flash(f"Artist '{artist['name']}' deleted.", "success")
-    except Exception as e:
-        flash(f"Cannot delete: {e}", "danger")
-
+    invalidate_options("artists")
+    invalidate_counts()
+    flash(f"Artist '{artist['name']}' deleted.", "success")
     return redirect(url_for("artists.index"))
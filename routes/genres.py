@@ -15,15 +15,24 @@ from flask import Blueprint, current_app, flash, redirect, render_template, requ
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import invalidate_options
 
 genres_bp = Blueprint("genres", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+SQL_LIST_GENRES    = "SELECT * FROM genres ORDER BY name"
+SQL_GET_GENRE      = "SELECT * FROM genres WHERE id = ?"
+SQL_INSERT_GENRE   = "INSERT INTO genres (name) VALUES (?)"
+SQL_UPDATE_GENRE   = "UPDATE genres SET name = ? WHERE id = ?"
+SQL_DELETE_GENRE   = "DELETE FROM genres WHERE id = ? RETURNING name"
+
 
 @genres_bp.route("/")
 @login_required
 def index():
     db = current_app.get_db()
-    genres = db.execute("SELECT * FROM genres ORDER BY name").fetchall()
+    genres = db.execute(SQL_LIST_GENRES).fetchall()
     return render_template("genres/index.html", genres=genres)
 
 
@@ -38,8 +47,10 @@ def create():
 
         db = current_app.get_db()
         try:
-            db.execute("INSERT INTO genres (name) VALUES (?)", (name,))
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_INSERT_GENRE, (name,))
+            invalidate_options("genres")
+            invalidate_counts()
             flash(f"Genre '{name}' created.", "success")
             return redirect(url_for("genres.index"))
         except Exception as e:
@@ -52,7 +63,7 @@ def create():
 @login_required
 def edit(genre_id):
     db    = current_app.get_db()
-    genre = db.execute("SELECT * FROM genres WHERE id = ?", (genre_id,)).fetchone()
+    genre = db.execute(SQL_GET_GENRE, (genre_id,)).fetchone()
 
     if genre is None:
         flash("Genre not found.", "danger")
@@ -65,8 +76,9 @@ def edit(genre_id):
             return render_template("genres/form.html", action="Update", genre=genre)
 
         try:
-            db.execute("UPDATE genres SET name = ? WHERE id = ?", (name, genre_id))
-            db.commit()
+            with db.transaction():
+                db.execute(SQL_UPDATE_GENRE, (name, genre_id))
+            invalidate_options("genres")
             flash(f"Genre '{name}' updated.", "success")
             return redirect(url_for("genres.index"))
         except Exception as e:
@@ -79,18 +91,21 @@ def edit(genre_id):
 @login_required
 @superuser_required
 def delete(genre_id):
-    db    = current_app.get_db()
-    genre = db.execute("SELECT name FROM genres WHERE id = ?", (genre_id,)).fetchone()
+    db = current_app.get_db()
+    try:
+        # RETURNING hands back the name for the flash message, so no separate
+        # existence-check SELECT is needed — no row means it didn't exist.
+        with db.transaction():
+            genre = db.execute(SQL_DELETE_GENRE, (genre_id,)).fetchone()
+    except Exception as e:
+        flash(f"Cannot delete: {e}", "danger")
+        return redirect(url_for("genres.index"))
 
     if genre is None:
         flash("Genre not found.", "danger")
         return redirect(url_for("genres.index"))
 
-    try:
-        db.execute("DELETE FROM genres WHERE id = ?", (genre_id,))
-        db.commit()
-        flash(f"Genre '{genre['name']}' deleted.", "success")
-    except Exception as e:
-        flash(f"Cannot delete: {e}", "danger")
-
+    invalidate_options("genres")
+    invalidate_counts()
+    flash(f"Genre '{genre['name']}' deleted.", "success")
     return redirect(url_for("genres.index"))
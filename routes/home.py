@@ -3,29 +3,109 @@ routes/home.py — Dashboard blueprint.
 
 Shows a summary card for each entity with a live record count fetched
 from the database.  Requires authentication.
+
+The counts are cached in process memory and served stale-while-revalidate:
+a hit within COUNTS_TTL seconds is answered from the cache, an older entry
+is still served immediately while a background thread recomputes it.
+Routes that add or remove rows call invalidate_counts() so the next
+dashboard hit recomputes the counts inline.
 """
 
+import threading
+import time
+
 from flask import Blueprint, current_app, render_template
 from flask_login import login_required
 
 home_bp = Blueprint("home", __name__)
 
+# Seconds a cached set of counts is considered fresh
+COUNTS_TTL = 30
+
+# `version` is bumped on every invalidation so that a background refresh
+# which started before a write cannot overwrite the cache with older counts.
+# _counts_lock guards every read and write of the dict; _refresh_lock is held
+# for the whole of a background refresh, so at most one runs at a time.
+_counts_cache = {"data": None, "ts": 0.0, "version": 0}
+_counts_lock  = threading.Lock()
+_refresh_lock = threading.Lock()
+
+
+def invalidate_counts():
+    """Drop the cached dashboard counts after a row is created or deleted."""
+    with _counts_lock:
+        _counts_cache["version"] += 1
+        _counts_cache["data"] = None
+
+
+def _fetch_counts(db):
+    """Return a dict of record counts for all seven tables."""
+    # Fetch every count in a single statement: one execute + one fetchone
+    # instead of seven separate round-trips into SQLite.
+    row = db.execute("""
+        SELECT (SELECT COUNT(*) FROM artists),
+               (SELECT COUNT(*) FROM albums),
+               (SELECT COUNT(*) FROM songs),
+               (SELECT COUNT(*) FROM genres),
+               (SELECT COUNT(*) FROM album_songs),
+               (SELECT COUNT(*) FROM song_genres),
+               (SELECT COUNT(*) FROM album_genres)
+    """).fetchone()
+
+    return {
+        "artists":     row[0],
+        "albums":      row[1],
+        "songs":       row[2],
+        "genres":      row[3],
+        "album_songs": row[4],
+        "song_genres": row[5],
+        "album_genres":row[6],
+    }
+
+
+def _store_counts(data, version):
+    """Cache `data` unless the cache was invalidated since `version` was read."""
+    with _counts_lock:
+        if _counts_cache["version"] == version:
+            _counts_cache["data"] = data
+            _counts_cache["ts"]   = time.monotonic()
+
+
+def _refresh_counts(app, version):
+    """Recompute the counts outside the request (runs in a daemon thread)."""
+    try:
+        with app.app_context():
+            _store_counts(_fetch_counts(app.get_db()), version)
+    finally:
+        _refresh_lock.release()
+
 
 @home_bp.route("/")
 @login_required
 def index():
     """Render the dashboard with record counts for all seven tables."""
-    db = current_app.get_db()
-
-    # Fetch counts for every table in one round-trip each
-    counts = {
-        "artists":     db.execute("SELECT COUNT(*) FROM artists").fetchone()[0],
-        "albums":      db.execute("SELECT COUNT(*) FROM albums").fetchone()[0],
-        "songs":       db.execute("SELECT COUNT(*) FROM songs").fetchone()[0],
-        "genres":      db.execute("SELECT COUNT(*) FROM genres").fetchone()[0],
-        "album_songs": db.execute("SELECT COUNT(*) FROM album_songs").fetchone()[0],
-        "song_genres": db.execute("SELECT COUNT(*) FROM song_genres").fetchone()[0],
-        "album_genres":db.execute("SELECT COUNT(*) FROM album_genres").fetchone()[0],
-    }
+    with _counts_lock:
+        counts  = _counts_cache["data"]
+        version = _counts_cache["version"]
+        age     = time.monotonic() - _counts_cache["ts"]
+
+    if counts is None:
+        # Nothing cached (first hit or just invalidated) — compute inline
+        counts = _fetch_counts(current_app.get_db())
+        _store_counts(counts, version)
+    elif age >= COUNTS_TTL:
+        # Stale — serve what we have and refresh in the background, unless
+        # another request has already started a refresh.
+        if _refresh_lock.acquire(blocking=False):
+            try:
+                threading.Thread(
+                    target=_refresh_counts,
+                    args=(current_app._get_current_object(), version),
+                    daemon=True,
+                ).start()
+            except RuntimeError:
+                # No thread could be started: free the lock so a later
+                # request can try again, and serve the stale counts for now.
+                _refresh_lock.release()
 
     return render_template("home.html", counts=counts)
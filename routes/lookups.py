@@ -0,0 +1,64 @@
+"""
+routes/lookups.py — Cached option lists for the <select> dropdowns.
+
+Several forms need the full list of artists, albums, songs or genres just to
+populate a dropdown.  Those tables change rarely, so the lists are kept in
+process memory and shared by every blueprint that needs them.
+
+Routes that create, rename or delete a row call invalidate_options(table)
+after committing.  Entries also expire after OPTIONS_TTL seconds, which
+bounds how long another Gunicorn worker can show a list that is out of date.
+
+index_url() similarly caches the URLs of argument-less endpoints that the
+write routes redirect to after every POST.
+"""
+
+import threading
+import time
+from functools import lru_cache
+
+from flask import request, url_for
+
+# Seconds a cached option list is reused before it is re-read
+OPTIONS_TTL = 30
+
+SQL_OPTIONS = {
+    "artists": "SELECT id, name  FROM artists ORDER BY name",
+    "albums":  "SELECT id, title FROM albums  ORDER BY title",
+    "songs":   "SELECT id, title FROM songs   ORDER BY title",
+    "genres":  "SELECT id, name  FROM genres  ORDER BY name",
+}
+
+_options_cache = {}   # table -> (rows, monotonic timestamp)
+_options_lock  = threading.Lock()
+
+
+def get_options(db, table):
+    """Return the (id, label) rows for `table`, reading them only when needed."""
+    with _options_lock:
+        entry = _options_cache.get(table)
+        if entry is None or time.monotonic() - entry[1] >= OPTIONS_TTL:
+            entry = (db.execute(SQL_OPTIONS[table]).fetchall(), time.monotonic())
+            _options_cache[table] = entry
+        return entry[0]
+
+
+def invalidate_options(table):
+    """Forget the cached list for `table` after one of its rows changed."""
+    with _options_lock:
+        _options_cache.pop(table, None)
+
+
+@lru_cache(maxsize=32)
+def _url_for_mount(endpoint, script_root):
+    return url_for(endpoint)
+
+
+def index_url(endpoint):
+    """
+    Return url_for(endpoint) for an endpoint that takes no arguments.
+
+    The URL only depends on where the app is mounted (SCRIPT_NAME), so it is
+    built once per mount point instead of walking the URL map on every call.
+    """
+    return _url_for_mount(endpoint, request.script_root)
@@ -8,76 +8,174 @@ Routes
 GET  /song-genres/        List all associations + show add form
 POST /song-genres/add     Create a new association
 POST /song-genres/remove  Remove an association (superuser only)
+
+The list page carries an ETag built from a digest of everything it shows and
+the app's build token, so a browser revisiting it gets a 304 without the page
+being re-rendered until the data or the release changes.  Neither part is
+worker-specific, so every Gunicorn worker computes the same ETag.
 """
 
-from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
-from flask_login import login_required
+import hashlib
+import sqlite3
+import threading
+
+from flask import (Blueprint, current_app, flash, make_response, redirect,
+                   render_template, request, session)
+from flask_login import current_user, login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import index_url
 
 song_genres_bp = Blueprint("song_genres", __name__)
 
-
-@song_genres_bp.route("/")
+# ── SQL ───────────────────────────────────────────────────────────────────────
+# The index page needs three lists — the associations plus the song and genre
+# dropdowns.  They are fetched in one UNION ALL; the `k` column tells which
+# list a row belongs to.  ORDER BY k keeps each list contiguous and sorts
+# every list by its own label columns.
+SQL_INDEX_ROWS = """
+    SELECT 'assoc' AS k,
+           s.id AS song_id,  s.title AS song_title,
+           g.id AS genre_id, g.name  AS genre_name
+    FROM song_genres sg
+    JOIN songs  s ON s.id = sg.song_id
+    JOIN genres g ON g.id = sg.genre_id
+    UNION ALL
+    SELECT 'song',  id,   title, NULL, NULL FROM songs
+    UNION ALL
+    SELECT 'genre', NULL, NULL,  id,   name FROM genres
+    ORDER BY k, song_title, genre_name
+"""
+SQL_INSERT_SONG_GENRE = "INSERT OR IGNORE INTO song_genres (song_id, genre_id) VALUES (?, ?)"
+SQL_DELETE_SONG_GENRE = "DELETE FROM song_genres WHERE song_id = ? AND genre_id = ?"
+
+# The three lists, stamped with the pool's data_version token when they were
+# read.  Any commit to the database changes the token, so a stale entry is
+# never served — the lists are simply re-read on the next request.
+_index_cache = {"version": None, "data": None}
+_index_lock  = threading.Lock()
+
+
+def _index_data(pool):
+    """
+    Return (rows, songs, genres, digest) for the list page.
+
+    The lists are re-read only after a commit; `digest` fingerprints them.
+    """
+    version = pool.data_version()
+    with _index_lock:
+        if _index_cache["version"] == version:
+            return _index_cache["data"]
+
+    # Split the combined result in a single pass over the cursor.  Rows are
+    # unpacked positionally rather than looked up by column name.  The token
+    # was read before the query, so a commit racing with it only makes the
+    # next request re-read once more.
+    rows, songs, genres = [], [], []
+    with pool.reader() as db:
+        for row in db.execute(SQL_INDEX_ROWS):
+            kind, song_id, song_title, genre_id, genre_name = row
+            if kind == "assoc":
+                rows.append(row)
+            elif kind == "song":
+                songs.append({"id": song_id, "title": song_title})
+            else:
+                genres.append({"id": genre_id, "name": genre_name})
+
+    digest = hashlib.blake2b(
+        repr(([tuple(row) for row in rows], songs, genres)).encode(), digest_size=8,
+    ).hexdigest()
+    data = (rows, songs, genres, digest)
+    with _index_lock:
+        _index_cache["version"], _index_cache["data"] = version, data
+    return data
+
+
+@song_genres_bp.route("/", strict_slashes=False)
 @login_required
 def index():
-    db = current_app.get_db()
-
-    rows = db.execute("""
-        SELECT s.id  AS song_id,  s.title  AS song_title,
-               g.id  AS genre_id, g.name   AS genre_name
-        FROM song_genres sg
-        JOIN songs  s ON s.id = sg.song_id
-        JOIN genres g ON g.id = sg.genre_id
-        ORDER BY s.title, g.name
-    """).fetchall()
-
-    songs  = db.execute("SELECT id, title FROM songs  ORDER BY title").fetchall()
-    genres = db.execute("SELECT id, name  FROM genres ORDER BY name").fetchall()
-
-    return render_template("song_genres/index.html", rows=rows, songs=songs, genres=genres)
+    rows, songs, genres, digest = _index_data(current_app.extensions["db_pool"])
+
+    # The page depends on the data, on the templates and stylesheet of this
+    # release, and on who is looking at it (superusers get Remove buttons,
+    # the sidebar shows the user name).
+    etag = f"{digest}-{current_app.build_token()}-{current_user.id}"
+
+    # A page carrying a flash message differs from the one the ETag stands
+    # for: it is always rendered, and sent without a validator so nothing
+    # downstream can turn it into a 304 either.
+    flashing = "_flashes" in session
+    if not flashing and request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(render_template(
+            "song_genres/index.html", rows=rows, songs=songs, genres=genres))
+
+    if not flashing:
+        # Weak, so Flask-Compress leaves it as is for every Content-Encoding
+        response.set_etag(etag, weak=True)
+    # Cached only by the browser, and always revalidated
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
 
 
 @song_genres_bp.route("/add", methods=["POST"])
 @login_required
 def add():
-    song_id  = request.form.get("song_id",  "").strip()
-    genre_id = request.form.get("genre_id", "").strip()
-
-    if not song_id or not genre_id:
+    """
+    Tag one song with one or more genres.
+
+    Several `genre_id` values may be posted at once.  All pairs go in with a
+    single executemany() inside one BEGIN IMMEDIATE transaction; pairs that
+    already exist are skipped (INSERT OR IGNORE) rather than failing the batch.
+    A value that is not an integer id rejects the whole request.
+    """
+    song_id   = request.form.get("song_id", "").strip()
+    genre_ids = [v.strip() for v in request.form.getlist("genre_id") if v.strip()]
+
+    if not song_id or not genre_ids:
         flash("Both song and genre are required.", "danger")
-        return redirect(url_for("song_genres.index"))
+        return redirect(index_url("song_genres.index"))
 
-    db = current_app.get_db()
     try:
-        db.execute(
-            "INSERT INTO song_genres (song_id, genre_id) VALUES (?, ?)",
-            (int(song_id), int(genre_id)),
-        )
-        db.commit()
-        flash("Association added.", "success")
-    except Exception as e:
+        pairs = [(int(song_id), int(genre_id)) for genre_id in genre_ids]
+    except ValueError:
+        flash("Invalid song or genre.", "danger")
+        return redirect(index_url("song_genres.index"))
+
+    try:
+        with current_app.extensions["db_pool"].writer() as db, db.transaction():
+            added = db.executemany(SQL_INSERT_SONG_GENRE, pairs).rowcount
+        invalidate_counts()
+        if added == 0:
+            flash("Association already exists.", "info")
+        elif added == 1:
+            flash("Association added.", "success")
+        else:
+            flash(f"{added} associations added.", "success")
+    except sqlite3.Error as e:
         flash(f"Error: {e}", "danger")
 
-    return redirect(url_for("song_genres.index"))
+    return redirect(index_url("song_genres.index"))
 
 
 @song_genres_bp.route("/remove", methods=["POST"])
 @login_required
 @superuser_required
 def remove():
-    song_id  = request.form.get("song_id",  "").strip()
-    genre_id = request.form.get("genre_id", "").strip()
+    song_id  = request.form.get("song_id",  type=int)
+    genre_id = request.form.get("genre_id", type=int)
+    if song_id is None or genre_id is None:
+        flash("Both song and genre are required.", "danger")
+        return redirect(index_url("song_genres.index"))
 
-    db = current_app.get_db()
     try:
-        db.execute(
-            "DELETE FROM song_genres WHERE song_id = ? AND genre_id = ?",
-            (int(song_id), int(genre_id)),
-        )
-        db.commit()
+        with current_app.extensions["db_pool"].writer() as db, db.transaction():
+            db.execute(SQL_DELETE_SONG_GENRE, (song_id, genre_id))
+        invalidate_counts()
         flash("Association removed.", "success")
-    except Exception as e:
+    except sqlite3.Error as e:
         flash(f"Error: {e}", "danger")
 
-    return redirect(url_for("song_genres.index"))
+    return redirect(index_url("song_genres.index"))
@@ -6,7 +6,7 @@ and accepted in m:ss format for usability.
 
 Routes
 ------
-GET  /songs/              List all songs
+GET  /songs/              List all songs (streamed)
 GET  /songs/new           Show create form
 POST /songs/new           Create a new song
 GET  /songs/<id>/edit     Show edit form
@@ -14,23 +14,46 @@ POST /songs/<id>/edit     Update a song
 POST /songs/<id>/delete   Delete a song (superuser only)
 """
 
-from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
+import sqlite3
+
+from flask import (Blueprint, current_app, flash, get_flashed_messages, redirect,
+                   render_template, request, stream_template)
 from flask_login import login_required
 
 from auth import superuser_required
+from routes.home import invalidate_counts
+from routes.lookups import get_options, index_url, invalidate_options
 
 songs_bp = Blueprint("songs", __name__)
 
+# ── SQL ───────────────────────────────────────────────────────────────────────
+# SQLite formats the duration as m:ss itself, so list and edit rows go
+# straight to the templates without a per-row Python copy.
+SQL_DURATION_DISPLAY = """
+    CASE WHEN duration IS NULL THEN ''
+         ELSE printf('%d:%02d', duration / 60, duration % 60)
+    END AS duration_display
+"""
+SQL_LIST_SONGS  = f"SELECT id, title, duration, {SQL_DURATION_DISPLAY} FROM songs ORDER BY title"
+# The edit form also shows the song's genres, so they come back in the same
+# query as a comma-separated list of ids.
+SQL_GET_SONG    = f"""
+    SELECT s.id, s.title, s.duration, {SQL_DURATION_DISPLAY},
+           GROUP_CONCAT(sg.genre_id) AS genre_ids
+    FROM songs s
+    LEFT JOIN song_genres sg ON sg.song_id = s.id
+    WHERE s.id = ?
+    GROUP BY s.id
+"""
+SQL_GET_TITLE   = "SELECT title FROM songs WHERE id = ?"
+SQL_INSERT_SONG = "INSERT INTO songs (title, duration) VALUES (?, ?) RETURNING id"
+SQL_UPDATE_SONG = "UPDATE songs SET title = ?, duration = ? WHERE id = ?"
+SQL_DELETE_SONG = "DELETE FROM songs WHERE id = ?"
 
-# ── Duration helpers ──────────────────────────────────────────────────────────
-
-def seconds_to_mmss(seconds: int) -> str:
-    """Convert an integer number of seconds to a 'm:ss' string."""
-    if seconds is None:
-        return ""
-    m, s = divmod(int(seconds), 60)
-    return f"{m}:{s:02d}"
 
+# ── Duration helpers ──────────────────────────────────────────────────────────
+# Seconds → m:ss happens in SQL (SQL_DURATION_DISPLAY); only the form input
+# needs parsing in Python.
 
 def mmss_to_seconds(mmss: str) -> int | None:
     """
@@ -39,32 +62,30 @@ def mmss_to_seconds(mmss: str) -> int | None:
     """
     if not mmss:
         return None
-    mmss = mmss.strip()
-    if ":" in mmss:
-        parts = mmss.split(":", 1)
-        try:
-            return int(parts[0]) * 60 + int(parts[1])
-        except ValueError:
-            return None
+    minutes, sep, secs = mmss.strip().partition(":")
     try:
-        return int(mmss)
+        return int(minutes) * 60 + int(secs) if sep else int(minutes)
     except ValueError:
         return None
 
 
 # ── Routes ────────────────────────────────────────────────────────────────────
 
-@songs_bp.route("/")
+@songs_bp.route("/", strict_slashes=False)
 @login_required
 def index():
-    db    = current_app.get_db()
-    songs = db.execute("SELECT * FROM songs ORDER BY title").fetchall()
-    # Convert duration to display format for the template
-    songs_display = [
-        {**dict(s), "duration_display": seconds_to_mmss(s["duration"])}
-        for s in songs
-    ]
-    return render_template("songs/index.html", songs=songs_display)
+    # The rows are read up front (the page shows the count before the table),
+    # so the pooled connection is back before the first byte is sent.
+    with current_app.extensions["db_pool"].reader() as db:
+        songs = db.execute(SQL_LIST_SONGS).fetchall()
+
+    # Pop the flash messages now: once streaming starts the session cookie
+    # has already gone out, so the template must not be the one to clear them.
+    # It reads the same list back from the request context.
+    get_flashed_messages(with_categories=True)
+
+    # Chunked and compressed per chunk by the app (see create_app)
+    return current_app.stream_response(stream_template("songs/index.html", songs=songs))
 
 
 @songs_bp.route("/new", methods=["GET", "POST"])
@@ -72,19 +93,23 @@ def index():
 def create():
     if request.method == "POST":
         title    = request.form.get("title", "").strip()
-        duration = mmss_to_seconds(request.form.get("duration", ""))
+        # Plain seconds convert directly; only m:ss needs the parser
+        duration = request.form.get("duration", type=int)
+        if duration is None:
+            duration = mmss_to_seconds(request.form.get("duration", ""))
 
         if not title:
             flash("Song title is required.", "danger")
             return render_template("songs/form.html", action="Create", song=None)
 
-        db = current_app.get_db()
         try:
-            db.execute("INSERT INTO songs (title, duration) VALUES (?, ?)", (title, duration))
-            db.commit()
-            flash(f"Song '{title}' created.", "success")
-            return redirect(url_for("songs.index"))
-        except Exception as e:
+            with current_app.extensions["db_pool"].writer() as db, db.transaction():
+                new_id = db.execute(SQL_INSERT_SONG, (title, duration)).fetchone()["id"]
+            invalidate_options("songs")
+            invalidate_counts()
+            flash(f"Song '{title}' created (ID {new_id}).", "success")
+            return redirect(index_url("songs.index"))
+        except sqlite3.Error as e:
             flash(f"Error: {e}", "danger")
 
     return render_template("songs/form.html", action="Create", song=None)
@@ -93,53 +118,61 @@ def create():
 @songs_bp.route("/<int:song_id>/edit", methods=["GET", "POST"])
 @login_required
 def edit(song_id):
-    db   = current_app.get_db()
-    song = db.execute("SELECT * FROM songs WHERE id = ?", (song_id,)).fetchone()
+    pool = current_app.extensions["db_pool"]
+    with pool.reader() as db:
+        song   = db.execute(SQL_GET_SONG, (song_id,)).fetchone()
+        genres = get_options(db, "genres")
 
     if song is None:
         flash("Song not found.", "danger")
-        return redirect(url_for("songs.index"))
+        return redirect(index_url("songs.index"))
+
+    # Shown read-only; associations are managed on the song_genres page
+    song_genres = {int(g) for g in song["genre_ids"].split(",")} if song["genre_ids"] else set()
+    form_args   = {"action": "Update", "song": song, "genres": genres, "song_genres": song_genres}
 
     if request.method == "POST":
         title    = request.form.get("title", "").strip()
-        duration = mmss_to_seconds(request.form.get("duration", ""))
+        # Plain seconds convert directly; only m:ss needs the parser
+        duration = request.form.get("duration", type=int)
+        if duration is None:
+            duration = mmss_to_seconds(request.form.get("duration", ""))
 
         if not title:
             flash("Song title is required.", "danger")
-            return render_template("songs/form.html", action="Update",
-                                   song={**dict(song), "duration_display": seconds_to_mmss(song["duration"])})
+            return render_template("songs/form.html", **form_args)
 
         try:
-            db.execute(
-                "UPDATE songs SET title = ?, duration = ? WHERE id = ?",
-                (title, duration, song_id),
-            )
-            db.commit()
+            with pool.writer() as db, db.transaction():
+                db.execute(SQL_UPDATE_SONG, (title, duration, song_id))
+            invalidate_options("songs")
             flash(f"Song '{title}' updated.", "success")
-            return redirect(url_for("songs.index"))
-        except Exception as e:
+            return redirect(index_url("songs.index"))
+        except sqlite3.Error as e:
             flash(f"Error: {e}", "danger")
 
-    song_display = {**dict(song), "duration_display": seconds_to_mmss(song["duration"])}
-    return render_template("songs/form.html", action="Update", song=song_display)
+    return render_template("songs/form.html", **form_args)
 
 
 @songs_bp.route("/<int:song_id>/delete", methods=["POST"])
 @login_required
 @superuser_required
 def delete(song_id):
-    db   = current_app.get_db()
-    song = db.execute("SELECT title FROM songs WHERE id = ?", (song_id,)).fetchone()
+    pool = current_app.extensions["db_pool"]
+    with pool.reader() as db:
+        song = db.execute(SQL_GET_TITLE, (song_id,)).fetchone()
 
     if song is None:
         flash("Song not found.", "danger")
-        return redirect(url_for("songs.index"))
+        return redirect(index_url("songs.index"))
 
     try:
-        db.execute("DELETE FROM songs WHERE id = ?", (song_id,))
-        db.commit()
+        with pool.writer() as db, db.transaction():
+            db.execute(SQL_DELETE_SONG, (song_id,))
+        invalidate_options("songs")
+        invalidate_counts()
         flash(f"Song '{song['title']}' deleted.", "success")
-    except Exception as e:
+    except sqlite3.Error as e:
         flash(f"Cannot delete: {e}", "danger")
 
-    return redirect(url_for("songs.index"))
+    return redirect(index_url("songs.index"))
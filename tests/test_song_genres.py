@@ -0,0 +1,71 @@
+"""
+tests/test_song_genres.py — Conditional GETs on the Song ↔ Genres list page.
+
+Run with:
+    python -m unittest discover tests
+"""
+
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+
+from app import create_app  # noqa: E402
+
+
+class SongGenresConditionalGetTest(unittest.TestCase):
+
+    def setUp(self):
+        # Seed a throw-away database instead of the one under instance/
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = self.make_client()
+
+    def make_client(self, **environ):
+        with mock.patch.object(Flask, "auto_find_instance_path", return_value=self.tmp.name), \
+             mock.patch.dict(os.environ, environ):
+            app = create_app()
+        client = app.test_client()
+        client.post("/auth/login", data={"username": "sandro63", "password": "sandro63"})
+        return client
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_flash_survives_if_none_match_with_gzip(self):
+        """A flash that changes no data must still be shown, not answered with 304."""
+        headers = {"Accept-Encoding": "gzip"}
+        etag = self.client.get("/song-genres/", headers=headers).headers["ETag"]
+
+        # Song 1 is already tagged with genre 1: flashes, leaves the data as is
+        redirect = self.client.post("/song-genres/add", data={"song_id": "1", "genre_id": "1"})
+        self.assertEqual(redirect.status_code, 302)
+
+        response = self.client.get(redirect.headers["Location"],
+                                   headers={**headers, "If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+        self.assertIn(b"Association already exists.", gzip.decompress(response.data))
+        # No validator on the flash page, so no later layer can answer 304 for it
+        self.assertNotIn("ETag", response.headers)
+
+    def test_unchanged_page_revalidates_to_304(self):
+        etag = self.client.get("/song-genres/").headers["ETag"]
+        response = self.client.get("/song-genres/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_release_changes_etag(self):
+        etag = self.client.get("/song-genres/").headers["ETag"]
+        redeployed = self.make_client(APP_VERSION="next-release")
+        response = redeployed.get("/song-genres/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+
+if __name__ == "__main__":
+    unittest.main()